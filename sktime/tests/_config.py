@@ -201,6 +201,11 @@ VALID_ESTIMATOR_TAGS = (
     "fit-in-transform",  # fitted in transform or non-fittable
     "univariate-only",
     "transform-returns-same-time-index",
+    # stateless transform applied to each column independently, so that
+    # multiple series can be transformed at once by passing them as columns
+    "vectorizable-over-instances",
+    # accepts 3d numpy arrays without coercing them to nested pandas DataFrames
+    "accepts-numpy",
 )
 
 # The following gives a list of valid estimator base classes.
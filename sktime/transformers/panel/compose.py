@@ -4,11 +4,20 @@
 This module has meta-transformers that is build using the pre-existing
 transformers as building blocks.
 """
+from functools import lru_cache
+from itertools import islice
+
 import numpy as np
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
+from numba import njit
+from numba import prange
+from numba.core.errors import TypingError
 from scipy import sparse
 from sklearn.base import clone
 from sklearn.compose import ColumnTransformer as _ColumnTransformer
+from sklearn.utils import _determine_key_type
 
 from sktime.transformers.base import BaseTransformer
 from sktime.transformers.base import _PanelToPanelTransformer
@@ -17,6 +26,7 @@ from sktime.transformers.base import _SeriesToPrimitivesTransformer
 from sktime.transformers.base import _SeriesToSeriesTransformer
 from sktime.utils.data_container import from_2d_array_to_nested
 from sktime.utils.data_container import from_3d_numpy_to_2d_array
+from sktime.utils.data_container import from_3d_numpy_to_nested
 from sktime.utils.data_container import from_nested_to_2d_array
 from sktime.utils.validation.panel import check_X
 
@@ -92,6 +102,18 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
     preserve_dataframe : boolean
         If True, pandas dataframe is returned.
         If False, numpy array is returned.
+    column_wise_parallel : boolean, default False
+        If True, transformers with the "univariate-only" tag that are given
+        multiple columns are applied to each column separately, with each
+        column being a separate job. This balances the load across jobs when
+        some transformers are given many more columns than others.
+    coerce_to_pandas : boolean or "auto", default "auto"
+        If True, input data is coerced to a nested pandas DataFrame.
+        If False, input data is passed on to the transformers as it is.
+        If "auto", 3d numpy arrays are passed on as they are if all
+        transformers accept numpy arrays (i.e. have the "accepts-numpy" tag)
+        and all columns are selected by position, otherwise they are coerced
+        to a nested pandas DataFrame.
 
 
     Attributes
@@ -107,6 +129,9 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         ``remainder`` parameter. If there are remaining columns, then
         ``len(transformers_)==len(transformers)+1``, otherwise
         ``len(transformers_)==len(transformers)``.
+        If ``column_wise_parallel=True``, `fitted_transformer` is a list with
+        one fitted transformer for each column for transformers applied
+        column-wise.
     named_transformers_ : Bunch object, a dictionary with attribute access
         Read-only attribute to access any transformer by given name.
         Keys are transformer names and values are the fitted transformer
@@ -127,6 +152,8 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         n_jobs=1,
         transformer_weights=None,
         preserve_dataframe=True,
+        column_wise_parallel=False,
+        coerce_to_pandas="auto",
     ):
         super(ColumnTransformer, self).__init__(
             transformers=transformers,
@@ -136,8 +163,80 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
             transformer_weights=transformer_weights,
         )
         self.preserve_dataframe = preserve_dataframe
+        self.column_wise_parallel = column_wise_parallel
+        self.coerce_to_pandas = coerce_to_pandas
         self._is_fitted = False
 
+    def _is_column_wise(self, transformer, column):
+        """Check if transformer is applied to each column separately"""
+        return (
+            self.column_wise_parallel
+            and _has_tag(transformer, "univariate-only")
+            and isinstance(column, (list, tuple, np.ndarray, pd.Index))
+            and len(column) > 1
+            and np.asarray(column).dtype != bool
+        )
+
+    def _iter(self, fitted=False, replace_strings=False, **kwargs):
+        """
+        Generate (name, trans, column, weight) tuples.
+
+        Transformers applied column-wise are expanded into one tuple per
+        column, named "<name>__<column>".
+        """
+        transformers = super(ColumnTransformer, self)._iter(
+            fitted=fitted, replace_strings=replace_strings, **kwargs
+        )
+        if not self.column_wise_parallel:
+            return transformers
+        return self._iter_column_wise(transformers, fitted=fitted)
+
+    def _iter_column_wise(self, transformers, fitted=False):
+        """Expand transformers applied column-wise into one tuple per column"""
+        for name, trans, column, weight in transformers:
+            if fitted and isinstance(trans, list):
+                for col, fitted_trans in zip(column, trans):
+                    yield f"{name}__{col}", fitted_trans, [col], weight
+            elif not fitted and self._is_column_wise(trans, column):
+                for col in column:
+                    yield f"{name}__{col}", trans, [col], weight
+            else:
+                yield name, trans, column, weight
+
+    def _update_fitted_transformers(self, transformers):
+        super(ColumnTransformer, self)._update_fitted_transformers(transformers)
+        if self.column_wise_parallel:
+            # Group the fitted transformers of expanded column-wise
+            # transformers back under the name of the original transformer
+            expanded = iter(self.transformers_)
+            transformers_ = []
+            for name, trans, column, _ in super(ColumnTransformer, self)._iter():
+                if self._is_column_wise(trans, column):
+                    fitted = [t for _, t, _ in islice(expanded, len(column))]
+                else:
+                    _, fitted, _ = next(expanded)
+                transformers_.append((name, fitted, column))
+            self.transformers_ = transformers_
+
+        # The names of the fitted transformers only change when refitting, so
+        # we collect them once here instead of on every call of transform
+        self._fitted_names_ = [
+            name for name, _, _, _ in self._iter(fitted=True, replace_strings=True)
+        ]
+
+    def _record_output_indices(self, Xs):
+        # Only defined in newer versions of scikit-learn, which record the
+        # output columns of each transformer under the names generated by
+        # _iter, so we merge those of transformers applied column-wise
+        super(ColumnTransformer, self)._record_output_indices(Xs)
+        if self.column_wise_parallel:
+            for name, trans, column in self.transformers_:
+                if isinstance(trans, list):
+                    slices = [
+                        self.output_indices_.pop(f"{name}__{col}") for col in column
+                    ]
+                    self.output_indices_[name] = slice(slices[0].start, slices[-1].stop)
+
     def _hstack(self, Xs):
         """
         Stacks X horizontally.
@@ -145,13 +244,17 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         Supports input types (X): list of numpy arrays, sparse arrays and
         DataFrames
         """
-        types = set(type(X) for X in Xs)
-
+        # Whether the output is sparse is decided once during fitting, while
+        # the output format depends on `preserve_dataframe` and the outputs of
+        # the current call
         if self.sparse_output_:
-            return sparse.hstack(Xs).tocsr()
-        if self.preserve_dataframe and (pd.Series in types or pd.DataFrame in types):
-            return pd.concat(Xs, axis="columns")
-        return np.hstack(Xs)
+            return _hstack_sparse(Xs)
+        # We stop scanning the outputs as soon as we find a pandas object
+        if self.preserve_dataframe and any(
+            isinstance(X, (pd.Series, pd.DataFrame)) for X in Xs
+        ):
+            return _hstack_pandas(Xs)
+        return _hstack_numpy(Xs)
 
     def _validate_output(self, result):
         """
@@ -160,28 +263,71 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
 
         Output can also be a pd.Series which is actually a 1D
         """
-        names = [
-            name for name, _, _, _ in self._iter(fitted=True, replace_strings=True)
+        bad = [
+            name
+            for Xs, name in zip(result, self._fitted_names_)
+            if not (isinstance(Xs, pd.Series) or getattr(Xs, "ndim", 0) == 2)
         ]
-        for Xs, name in zip(result, names):
-            if not (getattr(Xs, "ndim", 0) == 2 or isinstance(Xs, pd.Series)):
-                raise ValueError(
-                    "The output of the '{0}' transformer should be 2D (scipy "
-                    "matrix, array, or pandas DataFrame).".format(name)
-                )
+        if bad:
+            raise ValueError(
+                "The output of the '{0}' transformer should be 2D (scipy "
+                "matrix, array, or pandas DataFrame).".format(bad[0])
+            )
+
+    def _check_coerce_to_pandas(self):
+        """Check if input data has to be coerced to a nested DataFrame"""
+        if self.coerce_to_pandas != "auto":
+            return self.coerce_to_pandas
+
+        transformers = [(trans, column) for _, trans, column in self.transformers]
+        if self.remainder != "drop":
+            # remaining columns are always selected by position
+            transformers.append((self.remainder, None))
+
+        def _accepts_numpy(trans, column):
+            return (trans == "drop" or _has_tag(trans, "accepts-numpy")) and (
+                not callable(column)
+                and _determine_key_type(column) in ("int", "bool", None)
+            )
+
+        return not all(_accepts_numpy(trans, column) for trans, column in transformers)
+
+    def _fit_transform(self, X, y, func, fitted=False, **kwargs):
+        # scikit-learn only supports indexing columns of 2d arrays, so we select
+        # the columns of 3d numpy arrays ourselves
+        if not (isinstance(X, np.ndarray) and X.ndim == 3):
+            return super(ColumnTransformer, self)._fit_transform(
+                X, y, func, fitted=fitted, **kwargs
+            )
+        transformers = list(self._iter(fitted=fitted, replace_strings=True, **kwargs))
+        return Parallel(n_jobs=self.n_jobs)(
+            delayed(func)(
+                transformer=clone(trans) if not fitted else trans,
+                X=X[:, column],
+                y=y,
+                weight=weight,
+                message_clsname="ColumnTransformer",
+                message=self._log_message(name, idx, len(transformers)),
+            )
+            for idx, (name, trans, column, weight) in enumerate(transformers, 1)
+        )
 
     def fit(self, X, y=None):
-        X = check_X(X, coerce_to_pandas=True)
-        super(ColumnTransformer, self).fit(X, y)
-        self._is_fitted = True
+        # fit_transform sets the `_is_fitted` attribute
+        self.fit_transform(X, y)
         return self
 
     def transform(self, X, y=None):
         self.check_is_fitted()
-        X = check_X(X, coerce_to_pandas=True)
+        X = check_X(X, coerce_to_pandas=self._coerce_to_pandas)
         return super(ColumnTransformer, self).transform(X)
 
     def fit_transform(self, X, y=None):
+        # We check whether to coerce input data once during fitting, so that
+        # transform does not have to inspect the transformers again
+        self._coerce_to_pandas = self._check_coerce_to_pandas()
+        X = check_X(X, coerce_to_pandas=self._coerce_to_pandas)
+
         # Wrap fit_transform to set _is_fitted attribute
         Xt = super(ColumnTransformer, self).fit_transform(X, y)
         self._is_fitted = True
@@ -194,6 +340,8 @@ class ColumnConcatenator(_PanelToPanelTransformer):
         data by simply concatenating times series in time.
     """
 
+    _tags = {"accepts-numpy": True}
+
     def transform(self, X, y=None):
         """Concatenate multivariate time series/panel data into long
         univariate time series/panel
@@ -213,37 +361,114 @@ class ColumnConcatenator(_PanelToPanelTransformer):
         self.check_is_fitted()
         X = check_X(X)
 
-        # We concatenate by tabularizing all columns and then detabularizing
-        # them into a single column
+        # We concatenate by tabularizing all columns into a 2d numpy array and
+        # then detabularizing them into a single column, for 3d numpy arrays
+        # this is simply a reshape
         if isinstance(X, pd.DataFrame):
-            Xt = from_nested_to_2d_array(X)
+            Xt = from_nested_to_2d_array(X, return_numpy=True)
         else:
             Xt = from_3d_numpy_to_2d_array(X)
         return from_2d_array_to_nested(Xt)
 
 
+def _hstack_sparse(Xs):
+    return sparse.hstack(Xs).tocsr()
+
+
+def _hstack_pandas(Xs):
+    # Avoid copying the data of the individual outputs unless necessary
+    return pd.concat(Xs, axis="columns", copy=False)
+
+
+def _hstack_numpy(Xs):
+    # We directly convert any pandas output into a numpy array instead of
+    # concatenating it with pandas first
+    return np.hstack([_to_2d_array(X) for X in Xs])
+
+
+def _to_2d_array(X):
+    """Helper function to convert transformer output to 2d numpy array"""
+    if isinstance(X, pd.Series):
+        return X.to_numpy().reshape(-1, 1)
+    if isinstance(X, pd.DataFrame):
+        return X.to_numpy()
+    if sparse.issparse(X):
+        return X.toarray()
+    return np.asarray(X)
+
+
+def _has_tag(estimator, tag):
+    """Check if estimator has tag, estimators without tags (e.g. from
+    scikit-learn) are treated as not having the tag"""
+    return hasattr(estimator, "_all_tags") and estimator._all_tags().get(tag, False)
+
+
 def _from_nested_to_series(x):
     """Helper function to un-nest series"""
     if x.shape[0] == 1:
-        return np.asarray(x.iloc[0]).reshape(-1, 1)
+        return np.asarray(x.iat[0]).reshape(-1, 1)
     else:
-        data = x.tolist()
-        if not len(set([len(x) for x in data])) == 1:
+        arrs = [np.asarray(cell) for cell in x.values]
+        if not len(set(arr.shape[0] for arr in arrs)) == 1:
             raise NotImplementedError(
                 "Unequal length multivariate data are not supported yet."
             )
-        return pd.DataFrame(data).T
+        # stack series as columns, keeping the time index of nested series
+        index = getattr(x.iat[0], "index", None)
+        return pd.DataFrame(np.stack(arrs, axis=1), index=index)
+
+
+def _fit_transform_one(transformer, X, return_transformer=True):
+    """Helper function to fit and transform a single instance"""
+    Xt = transformer.fit_transform(X)
+    if return_transformer:
+        return Xt, transformer
+    return Xt
 
 
 class _RowTransformer(BaseTransformer):
-    """Base class for RowTransformer"""
+    """Base class for RowTransformer
+
+    Parameters
+    ----------
+    transformer : estimator
+        Series transformer to apply to each instance (row).
+    check_transformer : bool, optional (default=True)
+        If True, check that `transformer` is of the expected series
+        transformer type.
+    n_jobs : int, optional (default=1)
+        Number of jobs to run in parallel over instances.
+        None means 1 unless in a joblib.parallel_backend context.
+        -1 means using all processors.
+    prefer : {"processes", "threads"}, optional (default="processes")
+        Preferred joblib backend. Threads avoid the overhead of copying data
+        to other processes, but only give a speed-up if `transformer` releases
+        the GIL, e.g. when it is dominated by NumPy computations.
+    keep_fitted_instances : bool, optional (default=False)
+        If True, keep the clones of `transformer` fitted on each instance in
+        `transformer_` after transform for inspection. Otherwise, they are
+        released as soon as they have been applied and `transformer_` is set
+        to None. Transformers with the "vectorizable-over-instances" tag are
+        fitted once on all instances, so `transformer_` then holds the same
+        fitted clone for every instance.
+    """
 
     _required_parameters = ["transformer"]
-    _tags = {"fit-in-transform": True}
+    _tags = {"fit-in-transform": True, "accepts-numpy": True}
 
-    def __init__(self, transformer, check_transformer=True):
+    def __init__(
+        self,
+        transformer,
+        check_transformer=True,
+        n_jobs=1,
+        prefer="processes",
+        keep_fitted_instances=False,
+    ):
         self.transformer = transformer
         self.check_transformer = check_transformer
+        self.n_jobs = n_jobs
+        self.prefer = prefer
+        self.keep_fitted_instances = keep_fitted_instances
         super(_RowTransformer, self).__init__()
 
     def _check_transformer(self):
@@ -260,20 +485,151 @@ class _RowTransformer(BaseTransformer):
         self.check_is_fitted()
         self._check_transformer()
         X = check_X(X, coerce_to_numpy=True)
-        self.transformer_ = [clone(self.transformer) for _ in range(X.shape[0])]
         return X
 
+    def _fit_transform_rows(self, X):
+        """Fit and transform a clone of the transformer on each instance"""
+        # Series transformers expect series in columns, so we transpose X once
+        # into a C-contiguous array of shape (n_instances, n_timepoints,
+        # n_columns), rather than passing a non-contiguous view of each
+        # instance which transformers may end up copying
+        X = np.ascontiguousarray(X.transpose(0, 2, 1))
+        # We need to maintain the number of dimension when we slice, so that we
+        # still pass a 2-dimensional array to the transformer
+        results = Parallel(n_jobs=self.n_jobs, prefer=self.prefer)(
+            delayed(_fit_transform_one)(
+                clone(self.transformer), X[i], self.keep_fitted_instances
+            )
+            for i in range(X.shape[0])
+        )
+        if not self.keep_fitted_instances:
+            # Fitted clones are not returned from the workers, so they can be
+            # garbage collected as soon as they have been applied
+            self.transformer_ = None
+            return results
+        xts, transformers = zip(*results)
+        self.transformer_ = list(transformers)
+        return xts
+
+
+# We bound the number of cached reducers, as each one keeps its reducer_func
+# and compiled code alive
+@lru_cache(maxsize=8)
+def _make_row_reducer(reducer_func):
+    """Helper function to compile a reducer applying `reducer_func` to each
+    series of a 3d numpy array, parallelised over instances"""
+
+    @njit(parallel=True)
+    def _reduce(X, out):
+        for i in prange(X.shape[0]):
+            for j in range(X.shape[1]):
+                out[i, j] = reducer_func(X[i, j])
+
+    return _reduce
+
 
 class SeriesToPrimitivesRowTransformer(_RowTransformer, _PanelToTabularTransformer):
+    """Series-to-primitives row transformer
+
+    Parameters
+    ----------
+    transformer : estimator
+        Series-to-primitives transformer to apply to each instance (row).
+        Ignored if `reducer_func` is given.
+    check_transformer : bool, optional (default=True)
+        If True, check that `transformer` is a series-to-primitives
+        transformer.
+    n_jobs : int, optional (default=1)
+        Number of jobs to run in parallel over instances.
+        None means 1 unless in a joblib.parallel_backend context.
+        -1 means using all processors.
+    prefer : {"processes", "threads"}, optional (default="processes")
+        Preferred joblib backend. Threads avoid the overhead of copying data
+        to other processes, but only give a speed-up if `transformer` releases
+        the GIL, e.g. when it is dominated by NumPy computations.
+    keep_fitted_instances : bool, optional (default=False)
+        If True, keep the clones of `transformer` fitted on each instance in
+        `transformer_` after transform for inspection. Otherwise, they are
+        released as soon as they have been applied and `transformer_` is set
+        to None. Transformers with the "vectorizable-over-instances" tag are
+        fitted once on all instances, so `transformer_` then holds the same
+        fitted clone for every instance.
+    reducer_func : callable, optional (default=None)
+        Function reducing a single series (1d numpy array) to a scalar, which
+        must be supported by numba in nopython mode, e.g. np.mean or a
+        function decorated with numba.njit. If given, it is compiled and
+        applied to all series in parallel using numba's threading layer
+        instead of `transformer`. In this case, `transformer`,
+        `check_transformer`, `n_jobs`, `prefer` and `keep_fitted_instances`
+        are ignored and `transformer_` is set to None.
+    """
+
     _valid_transformer_type = _SeriesToPrimitivesTransformer
 
+    def __init__(
+        self,
+        transformer,
+        check_transformer=True,
+        n_jobs=1,
+        prefer="processes",
+        keep_fitted_instances=False,
+        reducer_func=None,
+    ):
+        self.reducer_func = reducer_func
+        super(SeriesToPrimitivesRowTransformer, self).__init__(
+            transformer,
+            check_transformer=check_transformer,
+            n_jobs=n_jobs,
+            prefer=prefer,
+            keep_fitted_instances=keep_fitted_instances,
+        )
+
+    def _check_transformer(self):
+        # transformer is not used if reducer_func is given
+        if self.reducer_func is None:
+            super(SeriesToPrimitivesRowTransformer, self)._check_transformer()
+
     def transform(self, X, y=None):
         X = self._prepare(X)
-        Xt = np.zeros(X.shape[:2])
-        for i in range(X.shape[0]):
-            # We need to maintain the number of dimension when we slice, so that we
-            # still pass a 2-dimensional array to the transformer
-            Xt[i] = self.transformer_[i].fit_transform(X[i].T)
+        n_instances, n_columns, n_timepoints = X.shape
+
+        if self.reducer_func is not None:
+            # compiled reducers are cached, so we can look them up on each call
+            # without recompiling them
+            reducer = _make_row_reducer(self.reducer_func)
+            Xt = np.empty((n_instances, n_columns))
+            try:
+                reducer(X, Xt)
+            except TypingError as e:
+                # reducers are compiled on their first call
+                raise TypeError(
+                    "`reducer_func` must be supported by numba in nopython "
+                    "mode, e.g. np.mean or a function decorated with "
+                    "numba.njit, but compiling it failed."
+                ) from e
+            # no transformers are fitted when using the reducer
+            self.transformer_ = None
+            return pd.DataFrame(Xt)
+
+        if _has_tag(self.transformer, "vectorizable-over-instances"):
+            # The transformer reduces each column independently, so we can
+            # transform all series in a single call, passing one series per
+            # column, instead of cloning and fitting it for each instance
+            transformer = clone(self.transformer)
+            Xt = transformer.fit_transform(X.reshape(-1, n_timepoints).T)
+            # all instances share the same fitted clone
+            self.transformer_ = (
+                [transformer] * n_instances if self.keep_fitted_instances else None
+            )
+            return pd.DataFrame(np.asarray(Xt).reshape(n_instances, n_columns))
+
+        xts = self._fit_transform_rows(X)
+        # Every row is overwritten below, so there is no need to initialise the
+        # output. Note that we allocate a new array on each call, as the returned
+        # DataFrame shares memory with it.
+        Xt = np.empty(X.shape[:2])
+        for i, xt in enumerate(xts):
+            Xt[i] = xt
         return pd.DataFrame(Xt)
 
 
@@ -282,11 +638,33 @@ class SeriesToSeriesRowTransformer(_RowTransformer, _PanelToPanelTransformer):
 
     def transform(self, X, y=None):
         X = self._prepare(X)
-        xts = list()
-        for i in range(X.shape[0]):
-            xt = self.transformer_[i].fit_transform(X[i].T)
-            xts.append(from_2d_array_to_nested(xt.T).T)
-        return pd.concat(xts, axis=0)
+        xts = self._fit_transform_rows(X)
+
+        for xt in xts:
+            if np.ndim(xt) != 2:
+                raise ValueError(
+                    f"The transformer must return a 2d output of shape "
+                    f"(n_timepoints, n_columns) for each instance, but found "
+                    f"output of shape: {np.shape(xt)}."
+                )
+
+        if len(set(np.shape(xt) for xt in xts)) == 1:
+            # If all transformed instances have the same shape, we stack them
+            # into a 3d array of shape (n_instances, n_columns, n_timepoints)
+            # and construct the nested DataFrame in one go
+            Xt = from_3d_numpy_to_nested(np.stack([np.asarray(xt).T for xt in xts]))
+            Xt.columns = pd.RangeIndex(Xt.shape[1])
+            return Xt
+
+        # Otherwise, we fill a preallocated array of cells with the transformed
+        # series and construct the nested DataFrame from it, instances with
+        # fewer output columns than others are filled with NaN
+        n_columns = max(np.shape(xt)[1] for xt in xts)
+        Xt = np.full((len(xts), n_columns), np.nan, dtype=object)
+        for i, xt in enumerate(xts):
+            for j, x in enumerate(np.asarray(xt).T):
+                Xt[i, j] = pd.Series(x)
+        return pd.DataFrame(Xt)
 
 
 def make_row_transformer(transformer, transformer_type=None, **kwargs):
@@ -2,6 +2,8 @@
 import numpy as np
 from sktime.datasets import load_basic_motions
 from sktime.transformers.panel.compose import ColumnConcatenator
+from sktime.utils.data_container import from_nested_to_2d_array
+from sktime.utils.data_container import from_nested_to_3d_numpy
 
 
 def test_TimeSeriesConcatenator():
@@ -24,3 +26,17 @@ def test_TimeSeriesConcatenator():
     # check specific observations
     assert X.iloc[0, -1].iloc[-3] == Xt.iloc[0, 0].iloc[-3]
     assert X.iloc[0, 0].iloc[3] == Xt.iloc[0, 0].iloc[3]
+
+
+def test_TimeSeriesConcatenator_numpy():
+    X, y = load_basic_motions(split="train", return_X_y=True)
+
+    trans = ColumnConcatenator()
+    expected = trans.fit_transform(X)
+    actual = trans.fit_transform(from_nested_to_3d_numpy(X))
+
+    assert actual.shape == expected.shape
+    np.testing.assert_array_equal(
+        from_nested_to_2d_array(actual, return_numpy=True),
+        from_nested_to_2d_array(expected, return_numpy=True),
+    )
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer as _ColumnTransformer
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import FunctionTransformer
@@ -8,14 +10,19 @@ from sklearn.preprocessing import StandardScaler
 
 from sktime.datasets import load_basic_motions
 from sktime.datasets import load_gunpoint
+from sktime.transformers.panel.compose import ColumnConcatenator
 from sktime.transformers.panel.compose import ColumnTransformer
 from sktime.transformers.panel.compose import (
     SeriesToPrimitivesRowTransformer,
 )
 from sktime.transformers.panel.compose import SeriesToSeriesRowTransformer
+from sktime.transformers.panel.compose import _from_nested_to_series
 from sktime.transformers.panel.reduce import Tabularizer
+from sktime.transformers.panel.segment import IntervalSegmenter
+from sktime.transformers.series.summarize import MeanTransformer
 from sktime.utils._testing.panel import _make_nested_from_array
 from sktime.utils.data_container import from_nested_to_2d_array
+from sktime.utils.data_container import from_nested_to_3d_numpy
 
 
 def test_row_transformer_function_transformer_series_to_primitives():
@@ -27,6 +34,81 @@ def test_row_transformer_function_transformer_series_to_primitives():
     assert isinstance(Xt.iloc[0, 0], float)  # check series-to-primitive transforms
 
 
+def test_row_transformer_series_to_primitives_returns_new_output():
+    X, y = load_gunpoint(return_X_y=True)
+    ft = FunctionTransformer(func=np.mean, validate=False)
+    t = SeriesToPrimitivesRowTransformer(ft, check_transformer=False)
+    Xt1 = t.fit_transform(X.iloc[:10])
+    Xt2 = t.transform(X.iloc[10:20])
+    assert not np.shares_memory(Xt1.values, Xt2.values)
+
+
+def test_row_transformer_vectorized_series_to_primitives():
+    X, y = load_basic_motions(return_X_y=True)
+
+    # MeanTransformer is transformed over all instances in a single call
+    t = SeriesToPrimitivesRowTransformer(MeanTransformer(), keep_fitted_instances=True)
+    actual = t.fit_transform(X)
+    assert len(t.transformer_) == X.shape[0]
+    assert all(transformer is t.transformer_[0] for transformer in t.transformer_)
+
+    # FunctionTransformer has no tags, so it is applied instance by instance
+    ft = FunctionTransformer(np.mean, kw_args={"axis": 0}, validate=False)
+    t = SeriesToPrimitivesRowTransformer(ft, check_transformer=False)
+    expected = t.fit_transform(X)
+
+    assert actual.shape == X.shape
+    np.testing.assert_array_almost_equal(actual, expected)
+
+
+@pytest.mark.parametrize("reducer_func", [np.mean, np.std])
+def test_row_transformer_reducer_func(reducer_func):
+    X, y = load_basic_motions(return_X_y=True)
+    ft = FunctionTransformer(reducer_func, kw_args={"axis": 0}, validate=False)
+
+    t = SeriesToPrimitivesRowTransformer(
+        ft, check_transformer=False, reducer_func=reducer_func
+    )
+    actual = t.fit_transform(X)
+
+    t = SeriesToPrimitivesRowTransformer(ft, check_transformer=False)
+    expected = t.fit_transform(X)
+
+    np.testing.assert_array_almost_equal(actual, expected)
+
+
+def test_row_transformer_reducer_func_set_params():
+    X, y = load_basic_motions(return_X_y=True)
+    ft = FunctionTransformer(np.mean, kw_args={"axis": 0}, validate=False)
+    t = SeriesToPrimitivesRowTransformer(
+        ft, check_transformer=False, reducer_func=np.mean, keep_fitted_instances=True
+    )
+    t.fit(X)
+    assert t.transform(X).shape == X.shape
+    assert t.transformer_ is None
+
+    # changing the reducer without refitting is picked up in transform
+    t.set_params(reducer_func=np.max)
+    expected = from_nested_to_3d_numpy(X).max(axis=2)
+    np.testing.assert_array_almost_equal(t.transform(X), expected)
+
+
+def test_row_transformer_reducer_func_ignores_transformer():
+    X, y = load_basic_motions(return_X_y=True)
+
+    # transformer is not type checked when it is not used
+    t = SeriesToPrimitivesRowTransformer(StandardScaler(), reducer_func=np.mean)
+    Xt = t.fit_transform(X)
+    np.testing.assert_array_almost_equal(Xt, from_nested_to_3d_numpy(X).mean(axis=2))
+
+    # reducer_func must be supported by numba in nopython mode
+    t = SeriesToPrimitivesRowTransformer(
+        StandardScaler(), reducer_func=lambda x: sorted(x)[0]
+    )
+    with pytest.raises(TypeError, match="nopython"):
+        t.fit_transform(X)
+
+
 def test_row_transformer_function_transformer_series_to_series():
     X, y = load_gunpoint(return_X_y=True)
 
@@ -40,11 +122,114 @@ def test_row_transformer_function_transformer_series_to_series():
     t = SeriesToSeriesRowTransformer(ft, check_transformer=False)
     Xt = t.fit_transform(X, y)
     assert Xt.shape == X.shape
+    # transformer is applied to 2d array of shape (n_timepoints, n_columns)
+    expected = powerspectrum(X.iloc[1, 0].to_numpy().reshape(-1, 1))
+    np.testing.assert_array_almost_equal(Xt.iloc[1, 0], expected.ravel())
     assert isinstance(
         Xt.iloc[0, 0], (pd.Series, np.ndarray)
     )  # check series-to-series transforms
 
 
+@pytest.mark.parametrize("prefer", ["processes", "threads"])
+def test_row_transformer_n_jobs(prefer):
+    X, y = load_basic_motions(return_X_y=True)
+    t = StandardScaler()
+
+    expected = SeriesToSeriesRowTransformer(t, check_transformer=False).fit_transform(X)
+    actual = SeriesToSeriesRowTransformer(
+        t, check_transformer=False, n_jobs=2, prefer=prefer
+    ).fit_transform(X)
+
+    np.testing.assert_array_almost_equal(
+        from_nested_to_2d_array(actual), from_nested_to_2d_array(expected)
+    )
+
+
+@pytest.mark.parametrize("keep_fitted_instances", [True, False])
+def test_row_transformer_keep_fitted_instances(keep_fitted_instances):
+    X, y = load_gunpoint(return_X_y=True)
+    t = SeriesToSeriesRowTransformer(
+        FunctionTransformer(func=np.abs, validate=False),
+        check_transformer=False,
+        keep_fitted_instances=keep_fitted_instances,
+    )
+    Xt = t.fit_transform(X)
+    assert Xt.shape == X.shape
+
+    if keep_fitted_instances:
+        assert len(t.transformer_) == X.shape[0]
+        assert all(
+            isinstance(transformer, FunctionTransformer)
+            and transformer is not t.transformer
+            for transformer in t.transformer_
+        )
+    else:
+        assert t.transformer_ is None
+
+
+def test_row_transformer_passes_contiguous_instances():
+    X, y = load_basic_motions(return_X_y=True)
+
+    def check_contiguous(x):
+        # instances are passed with series in columns
+        assert x.shape == (X.iloc[0, 0].shape[0], X.shape[1])
+        assert x.flags.c_contiguous
+        return x
+
+    ft = FunctionTransformer(func=check_contiguous, validate=False)
+    t = SeriesToSeriesRowTransformer(ft, check_transformer=False)
+    t.fit_transform(X)
+
+
+def test_row_transformer_series_to_series_unequal_length_output():
+    X, y = load_basic_motions(return_X_y=True)
+    X = X.iloc[:10]
+
+    # transform each instance into series of different lengths
+    def drop_last(x):
+        return x[: int(x[0, 0] > 0) - 2]
+
+    ft = FunctionTransformer(func=drop_last, validate=False)
+    t = SeriesToSeriesRowTransformer(ft, check_transformer=False)
+    Xt = t.fit_transform(X)
+
+    assert Xt.shape == X.shape
+    for i in range(X.shape[0]):
+        for j in range(X.shape[1]):
+            expected = drop_last(np.column_stack(X.iloc[i]))[:, j]
+            np.testing.assert_array_equal(Xt.iloc[i, j], expected)
+
+
+def test_row_transformer_series_to_series_unequal_columns_output():
+    X = np.ones((3, 2, 5))
+    X[1] *= 2
+
+    # transform each instance into a different number of columns
+    def select_columns(x):
+        return x[:, : int(x[0, 0])]
+
+    ft = FunctionTransformer(func=select_columns, validate=False)
+    t = SeriesToSeriesRowTransformer(ft, check_transformer=False)
+    Xt = t.fit_transform(X)
+
+    assert Xt.shape == (3, 2)
+    np.testing.assert_array_equal(Xt.iloc[0, 0], np.ones(5))
+    np.testing.assert_array_equal(Xt.iloc[1, 1], np.full(5, 2.0))
+    assert np.isnan(Xt.iloc[0, 1])
+    assert np.isnan(Xt.iloc[2, 1])
+
+
+def test_row_transformer_series_to_series_raises_on_1d_output():
+    X, y = load_gunpoint(return_X_y=True)
+    X = X.iloc[:5]
+    t = SeriesToSeriesRowTransformer(
+        FunctionTransformer(func=lambda x: np.abs(x[:, 0]), validate=False),
+        check_transformer=False,
+    )
+    with pytest.raises(ValueError, match="2d output"):
+        t.fit_transform(X)
+
+
 def test_row_transformer_sklearn_transfomer():
     mu = 10
     X = _make_nested_from_array(
@@ -152,3 +337,174 @@ def test_RowTransformer_pipeline():
     model.fit(X_train, y_train)
     actual = model.predict(X_test)
     np.testing.assert_array_equal(expected, actual)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_ColumnTransformer_column_wise_parallel(n_jobs):
+    X, y = load_basic_motions(return_X_y=True)
+    columns = ["dim_0", "dim_1", "dim_2"]
+
+    # univariate-only transformer is applied to each column separately
+    column_transformer = ColumnTransformer(
+        [("segment", IntervalSegmenter(intervals=3), columns)],
+        n_jobs=n_jobs,
+        column_wise_parallel=True,
+    )
+    actual = column_transformer.fit_transform(X)
+
+    fitted = column_transformer.named_transformers_["segment"]
+    assert isinstance(fitted, list)
+    assert len(fitted) == len(columns)
+    np.testing.assert_array_equal(
+        from_nested_to_2d_array(column_transformer.transform(X), return_numpy=True),
+        from_nested_to_2d_array(actual, return_numpy=True),
+    )
+
+    column_transformer = ColumnTransformer(
+        [
+            (f"segment{i}", IntervalSegmenter(intervals=3), [column])
+            for i, column in enumerate(columns)
+        ],
+        n_jobs=n_jobs,
+    )
+    expected = column_transformer.fit_transform(X)
+
+    np.testing.assert_array_equal(
+        from_nested_to_2d_array(actual, return_numpy=True),
+        from_nested_to_2d_array(expected, return_numpy=True),
+    )
+
+
+@pytest.mark.skipif(
+    not hasattr(_ColumnTransformer, "_record_output_indices"),
+    reason="output_indices_ requires a newer version of scikit-learn",
+)
+def test_ColumnTransformer_column_wise_parallel_output_indices():
+    X, y = load_basic_motions(return_X_y=True)
+    column_transformer = ColumnTransformer(
+        [
+            ("segment", IntervalSegmenter(intervals=3), ["dim_0", "dim_1"]),
+            ("concat", ColumnConcatenator(), ["dim_2"]),
+        ],
+        column_wise_parallel=True,
+    )
+    column_transformer.fit(X)
+    output_indices = column_transformer.output_indices_
+    assert output_indices["segment"] == slice(0, 6)
+    assert output_indices["concat"] == slice(6, 7)
+    assert not any("__" in name for name in output_indices)
+
+
+def test_from_nested_to_series():
+    X, y = load_basic_motions(return_X_y=True)
+    x = X.iloc[0, :3]
+    xt = _from_nested_to_series(x)
+    assert xt.shape == (x.iloc[0].shape[0], 3)
+    for i in range(3):
+        np.testing.assert_array_equal(xt.iloc[:, i], x.iloc[i])
+
+    xt = _from_nested_to_series(X.iloc[0, :1])
+    assert xt.shape == (x.iloc[0].shape[0], 1)
+
+    x = pd.Series([pd.Series(np.arange(3)), pd.Series(np.arange(4))])
+    with pytest.raises(NotImplementedError):
+        _from_nested_to_series(x)
+
+
+@pytest.mark.parametrize("coerce_to_pandas", [True, "auto"])
+def test_ColumnTransformer_coerce_to_pandas(coerce_to_pandas):
+    X, y = load_basic_motions(return_X_y=True)
+    X_numpy = from_nested_to_3d_numpy(X)
+
+    column_transformer = ColumnTransformer(
+        [
+            (
+                "mean",
+                SeriesToPrimitivesRowTransformer(MeanTransformer()),
+                [0, 1],
+            ),
+            (
+                "scale",
+                SeriesToSeriesRowTransformer(StandardScaler(), check_transformer=False),
+                slice(2, 4),
+            ),
+        ],
+        coerce_to_pandas=coerce_to_pandas,
+    )
+    expected = column_transformer.fit_transform(X)
+    assert column_transformer._coerce_to_pandas == (coerce_to_pandas is True)
+
+    column_transformer.fit(X_numpy)
+    actual = column_transformer.transform(X_numpy)
+    np.testing.assert_array_almost_equal(
+        from_nested_to_2d_array(actual.iloc[:, 2:], return_numpy=True),
+        from_nested_to_2d_array(expected.iloc[:, 2:], return_numpy=True),
+    )
+    np.testing.assert_array_almost_equal(actual.iloc[:, :2], expected.iloc[:, :2])
+
+
+def test_ColumnTransformer_coerce_to_pandas_auto_with_column_names():
+    X, y = load_basic_motions(return_X_y=True)
+    column_transformer = ColumnTransformer(
+        [("mean", SeriesToPrimitivesRowTransformer(MeanTransformer()), ["dim_0"])]
+    )
+    column_transformer.fit(X)
+    # columns selected by name require pandas DataFrame
+    assert column_transformer._coerce_to_pandas
+
+
+def test_ColumnTransformer_validate_output():
+    X, y = load_basic_motions(return_X_y=True)
+
+    def first_value(X):
+        # returns 1d array instead of 2d array
+        return from_nested_to_2d_array(X, return_numpy=True)[:, 0]
+
+    column_transformer = ColumnTransformer(
+        [
+            ("id", FunctionTransformer(validate=False), ["dim_0"]),
+            ("first", FunctionTransformer(func=first_value, validate=False), ["dim_1"]),
+        ]
+    )
+    with pytest.raises(ValueError, match="'first'"):
+        column_transformer.fit_transform(X)
+    assert column_transformer._fitted_names_ == ["id", "first"]
+
+
+def test_ColumnTransformer_preserve_dataframe_false():
+    X, y = load_basic_motions(return_X_y=True)
+
+    def row_max(X):
+        # return a DataFrame, as newer versions of scikit-learn only support
+        # 2d outputs
+        return X.iloc[:, [0]].applymap(np.max)
+
+    column_transformer = ColumnTransformer(
+        [
+            ("mean", SeriesToPrimitivesRowTransformer(MeanTransformer()), [0, 1]),
+            ("max", FunctionTransformer(func=row_max, validate=False), [2]),
+        ],
+        preserve_dataframe=False,
+    )
+    Xt = column_transformer.fit_transform(X)
+
+    assert isinstance(Xt, np.ndarray)
+    assert Xt.shape == (X.shape[0], 3)
+    np.testing.assert_array_almost_equal(Xt[:, 2], row_max(X.iloc[:, [2]]).iloc[:, 0])
+
+
+@pytest.mark.parametrize("preserve_dataframe", [True, False])
+def test_ColumnTransformer_set_preserve_dataframe(preserve_dataframe):
+    X, y = load_basic_motions(return_X_y=True)
+    column_transformer = ColumnTransformer(
+        [("mean", SeriesToPrimitivesRowTransformer(MeanTransformer()), [0, 1])],
+        preserve_dataframe=preserve_dataframe,
+    )
+    Xt = column_transformer.fit_transform(X)
+    assert isinstance(Xt, pd.DataFrame) is preserve_dataframe
+
+    # changing the output format without refitting is picked up in transform
+    column_transformer.set_params(preserve_dataframe=not preserve_dataframe)
+    actual = column_transformer.transform(X)
+    assert isinstance(actual, pd.DataFrame) is not preserve_dataframe
+    np.testing.assert_array_equal(np.asarray(actual), np.asarray(Xt))
@@ -11,6 +11,8 @@ from sktime.utils.validation.series import check_series
 
 
 class MeanTransformer(_SeriesToPrimitivesTransformer):
+    _tags = {"vectorizable-over-instances": True}
+
     def transform(self, Z, X=None):
         self.check_is_fitted()
         Z = check_series(Z)
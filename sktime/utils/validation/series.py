@@ -60,8 +60,9 @@ def check_series(Z, enforce_univariate=False, allow_empty=False, allow_numpy=Tru
     if enforce_univariate:
         _check_is_univariate(Z)
 
-    # check time index
-    check_time_index(Z.index, allow_empty=allow_empty)
+    # check time index, numpy arrays only have an implicit integer index
+    if not isinstance(Z, np.ndarray):
+        check_time_index(Z.index, allow_empty=allow_empty)
     return Z
 
 